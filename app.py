@@ -1,5 +1,6 @@
 # Minimal Flask app to expose the three scripts to the UI.
-from flask import Flask, jsonify, request, send_from_directory, render_template
+from flask import Blueprint, Flask, Response, json, request
+from functools import wraps
 from inverted_sigil_recycler import recycler
 from frequency_tuner import FrequencyTuner
 import chimera_syntax_engine
@@ -8,24 +9,87 @@ import threading
 import time
 import random
 import os
+import sched
+import hashlib
+import atexit
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # optional: fall back to Flask's stdlib-based encoder
+    orjson = None
+
+try:
+    import fcntl
+except ImportError:  # not available on Windows; single-process there anyway
+    fcntl = None
 
 app = Flask(__name__, static_folder='.', template_folder='templates')
+api_bp = Blueprint('api', __name__, url_prefix='/api')
 
 # Create tuner instance globally so routes can access it
 tuner = FrequencyTuner(target_hz=712.8, interval_seconds=60)
-try:
-    tuner.start()
-except Exception:
-    pass
 
 # --- SIMULATION STATE (From Dashboard Branch) ---
-nodes = [
-    {"id": "NODE_ALPHA_01", "status": "ONLINE", "load": 42, "code": "8F2-X91"},
-    {"id": "NODE_BETA_04", "status": "UNSTABLE", "load": 98, "code": "7B1-Z00"},
-    {"id": "NODE_GAMMA_09", "status": "IDLE", "load": 0, "code": "3C4-Y22"},
-    {"id": "NODE_DELTA_12", "status": "ONLINE", "load": 67, "code": "9X9-A11"},
-    {"id": "NODE_EPSILON_88", "status": "ONLINE", "load": 33, "code": "1L1-M33"},
-]
+# Nodes are stored as parallel arrays (one entry per node) so the per-poll
+# simulation runs as a single vectorized pass. Statuses are small ints.
+ONLINE, UNSTABLE, IDLE, OFFLINE = 0, 1, 2, 3
+STATUS_NAMES = ("ONLINE", "UNSTABLE", "IDLE", "OFFLINE")
+
+node_ids = ["NODE_ALPHA_01", "NODE_BETA_04", "NODE_GAMMA_09", "NODE_DELTA_12", "NODE_EPSILON_88"]
+node_codes = ["8F2-X91", "7B1-Z00", "3C4-Y22", "9X9-A11", "1L1-M33"]
+node_status = np.array([ONLINE, UNSTABLE, IDLE, ONLINE, ONLINE], dtype=np.int8)
+node_load = np.array([42, 98, 0, 67, 33], dtype=np.int16)
+# Nodes are only ever appended, so a seed node's index never changes
+_BETA_IDX = node_ids.index("NODE_BETA_04")
+_nodes_lock = threading.Lock()
+
+_RNG = threading.local()
+
+def _rng():
+    """Per-thread NumPy generator (avoids sharing one RNG across request threads)."""
+    r = getattr(_RNG, 'r', None)
+    if r is None:
+        r = _RNG.r = np.random.default_rng()
+    return r
+
+NOISE_BLOCK = 1024  # even, so draws always come out in pairs
+
+def _jitter_pair():
+    """Two integrity jitters in [-0.1, 0.1), drawn from a per-thread block
+    that is regenerated in one vectorized call when it runs out."""
+    buf = getattr(_RNG, 'noise', None)
+    if not buf:
+        buf = _RNG.noise = _rng().uniform(-0.1, 0.1, size=NOISE_BLOCK).tolist()
+    return buf.pop(), buf.pop()
+
+def _py_rng():
+    """Per-thread random.Random for scalar draws outside the vectorized path."""
+    r = getattr(_RNG, 'py', None)
+    if r is None:
+        r = _RNG.py = random.Random()
+    return r
+
+def _add_node(node_id, status, load, code):
+    global node_status, node_load
+    with _nodes_lock:
+        node_ids.append(node_id)
+        node_codes.append(code)
+        node_status = np.append(node_status, np.int8(status))
+        node_load = np.append(node_load, np.int16(load))
+
+def _nodes_payload():
+    """Materialize the node arrays as the list of dicts the dashboard expects."""
+    with _nodes_lock:
+        return [
+            {"id": node_id, "status": STATUS_NAMES[status], "load": load, "code": code}
+            for node_id, code, status, load in zip(node_ids, node_codes, node_status.tolist(), node_load.tolist())
+        ]
+
+def _purge_nodes():
+    with _nodes_lock:
+        node_load[:] = 0
+        node_status[node_status == UNSTABLE] = ONLINE
 
 telemetry = {
     "target_resonance": 712.8,
@@ -34,156 +98,340 @@ telemetry = {
     "entropic_fuel": 42.1,
 }
 
+# --- BACKGROUND MONITOR ---
+# All periodic work (tuner scans, node checks and telemetry logging) runs
+# cooperatively on one scheduler thread, each task on its own cadence. The
+# thread sleeps until the next task is due.
+BETA_CHECK_INTERVAL = 5
+TELEMETRY_LOG_INTERVAL = 60
+_stop_event = threading.Event()
+_sched = sched.scheduler(time.monotonic, _stop_event.wait)
+
+def _run_every(interval, action):
+    """Schedule `action` now and then every `interval` seconds (no drift)."""
+    def tick(deadline):
+        if _stop_event.is_set():
+            return
+        try:
+            action()
+        except Exception as exc:
+            print(f"Background task {action.__name__} failed: {exc}")
+        if _stop_event.is_set():
+            return  # stopped while the action ran; don't re-arm
+        _sched.enterabs(deadline + interval, 1, tick, (deadline + interval,))
+    now = time.monotonic()
+    _sched.enterabs(now, 1, tick, (now,))
+
+def _check_beta_node():
+    # Logic Synchronization: Monitor Node_Beta_04
+    status = node_status[_BETA_IDX]
+    if status == OFFLINE:
+        # Use the module to consume failure
+        recycler.consume_failure("Node_Beta_04 OFFLINE")
+    elif status == UNSTABLE and node_load[_BETA_IDX] > 99:
+        recycler.consume_failure("Node_Beta_04 CRITICAL LOAD")
+
+def _log_telemetry():
+    # Data Persistence: sync telemetry with modules and queue it for the DB
+    status = tuner.get_status()
+    telemetry["target_resonance"] = status.get("current_resonance", 712.8)
+    telemetry["entropic_fuel"] = recycler.current_fuel
+
+    # Queued; db's flusher thread writes it in a batch
+    db.log_telemetry(telemetry["gnosis_integrity"], telemetry["entropic_fuel"])
+    print(f"Telemetry logged: Gnosis={telemetry['gnosis_integrity']}, Fuel={telemetry['entropic_fuel']}")
+
 def background_monitor():
     """
     Background thread to monitor system status and log telemetry.
     """
-    last_log_time = 0
     print("Background monitor started.")
+    _run_every(tuner.interval_seconds, tuner.scan)
+    _run_every(BETA_CHECK_INTERVAL, _check_beta_node)
+    _run_every(TELEMETRY_LOG_INTERVAL, _log_telemetry)
+    _sched.run()
+
+# Only one process may own the simulation loops. Server processes race for
+# an exclusive lock on this file; the lock is released when the owner exits,
+# and a process that lost the race waits on it, so a restarted worker (e.g.
+# after a gunicorn HUP) takes over once the old one is gone. The lock sits
+# next to the database it guards, so separate checkouts don't contend.
+LOCK_FILE = os.environ.get('CRUCIBLE_LOCK_FILE', os.path.abspath(db.DB_NAME) + '.lock')
+_start_lock = threading.Lock()
+_started = False
+_owner_lock_fd = None
+
+def _acquire_owner_lock(blocking=False):
+    global _owner_lock_fd
+    if fcntl is None:
+        return True
+    fd = os.open(LOCK_FILE, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        os.close(fd)
+        return False
+    _owner_lock_fd = fd  # held open for the life of the process
+    return True
+
+def _await_ownership():
+    # Blocks until the current owner exits, then runs the loops here
+    if not _acquire_owner_lock(blocking=True) or _stop_event.is_set():
+        return
+    print("Background task lock acquired; taking over.")
+    background_monitor()
+
+def start_background_tasks():
+    """Start the background monitor thread, now or once this process owns the loops.
+
+    Safe to call repeatedly and from several threads or server processes;
+    at most one monitor runs per lock file.
+    """
+    global _started
+    with _start_lock:
+        if _started:
+            return
+        _started = True
+        if _acquire_owner_lock():
+            threading.Thread(target=background_monitor, daemon=True).start()
+            return
+        print("Background tasks owned by another process; waiting to take over.")
+        threading.Thread(target=_await_ownership, name="owner-wait", daemon=True).start()
+
+def stop_background_tasks():
+    """Stop the monitor promptly and write out buffered telemetry.
+
+    Runs from gunicorn's worker_exit hook and at interpreter exit (covering
+    the dev server and other hosts); calling it more than once is harmless.
+    """
+    _stop_event.set()  # first, so a tick in flight won't re-enqueue itself
+    while _sched.queue:
+        try:
+            _sched.cancel(_sched.queue[0])
+        except ValueError:
+            pass  # popped by the monitor thread meanwhile
+    db.flush()
+
+atexit.register(stop_background_tasks)
 
-    while True:
-        current_time = time.time()
+# Initialize DB
+db.init_db()
+# gunicorn starts the loops from its post_worker_init hook and the dev server
+# from the __main__ block below; any other import (e.g. a WSGI container or a
+# test client) starts them right away.
+if __name__ != '__main__' and not os.environ.get('CRUCIBLE_DEFER_START'):
+    start_background_tasks()
 
-        # 1. Logic Synchronization: Monitor Node_Beta_04
-        beta_node = next((n for n in nodes if n["id"] == "NODE_BETA_04"), None)
-        if beta_node:
-            if beta_node["status"] == "OFFLINE":
-                # Use the module to consume failure
-                recycler.consume_failure("Node_Beta_04 OFFLINE")
-            elif beta_node["status"] == "UNSTABLE" and beta_node["load"] > 99:
-                 recycler.consume_failure("Node_Beta_04 CRITICAL LOAD")
 
-        # 2. Data Persistence: Log telemetry every 60 seconds
-        if current_time - last_log_time >= 60:
-            # Sync telemetry with modules
-            status = tuner.get_status()
-            telemetry["target_resonance"] = status.get("current_resonance", 712.8)
-            telemetry["entropic_fuel"] = recycler.current_fuel
+# --- JSON ENCODING ---
+def _dumps(payload):
+    """Encode a response payload straight to bytes (orjson when installed)."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SERIALIZE_NUMPY)
+    return json.dumps(payload).encode('utf-8')
 
-            # Log to DB
-            db.log_telemetry(telemetry["gnosis_integrity"], telemetry["entropic_fuel"])
-            print(f"Telemetry logged: Gnosis={telemetry['gnosis_integrity']}, Fuel={telemetry['entropic_fuel']}")
-            last_log_time = current_time
+def _json(payload):
+    """JSON response for API endpoints (drop-in for flask.jsonify)."""
+    return Response(_dumps(payload), mimetype='application/json')
 
-        time.sleep(1) # Check loop frequency
 
-# Initialize DB
-db.init_db()
-# Start background thread
-monitor_thread = threading.Thread(target=background_monitor, daemon=True)
-monitor_thread.start()
+# --- RESPONSE CACHE ---
+# Dashboards poll the read-only endpoints every couple of seconds; within a
+# short window the answer barely moves, so opted-in routes reuse the last
+# encoded body instead of recomputing it.
+_status_cache = {}  # route -> (fetched_at_monotonic, cached_json_bytes)
+
+def ttl_cache(ms=250):
+    """Serve the last JSON body for this route while it is younger than `ms`.
+
+    Pass `?fresh=1` to bypass the cache and force a recompute.
+    """
+    ttl = ms / 1000.0
+
+    def decorator(view):
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            route = request.path
+            if request.args.get('fresh') != '1':
+                entry = _status_cache.get(route)
+                if entry is not None and time.monotonic() - entry[0] < ttl:
+                    return Response(entry[1], mimetype='application/json')
+            body = _dumps(view(*args, **kwargs))
+            # Stamp after computing so the cache age reflects the data age
+            _status_cache[route] = (time.monotonic(), body)
+            return Response(body, mimetype='application/json')
+        return wrapper
+    return decorator
+
+def invalidate_cache(*routes):
+    """Drop cached bodies after a state change so the next poll is fresh."""
+    for route in routes:
+        _status_cache.pop(route, None)
 
 
 # --- ROUTES ---
 
+# The dashboard page is static: read it once and let browsers revalidate
+# against its ETag instead of re-reading the file on every page load.
+with open(os.path.join(app.root_path, app.template_folder, 'index.html'), 'rb') as f:
+    _INDEX_BYTES = f.read()
+_INDEX_ETAG = hashlib.md5(_INDEX_BYTES, usedforsecurity=False).hexdigest()
+
 @app.route('/')
 def index():
-    return render_template('index.html')
+    resp = Response(_INDEX_BYTES, mimetype='text/html')
+    resp.set_etag(_INDEX_ETAG)
+    resp.cache_control.max_age = 60
+    return resp.make_conditional(request)
 
 # -- Dashboard API Endpoints --
 
-@app.route('/api/nodes')
+# Below this many nodes the per-call numpy overhead outweighs the loop it
+# replaces (~11 us vs ~36 us at 5 nodes, ~430 us vs ~140 us at 500;
+# break-even is around 50 nodes).
+VECTORIZE_MIN_NODES = 50
+
+def _step_nodes_scalar():
+    # Same transitions as the vectorized pass, on plain Python values
+    r = _py_rng()
+    statuses = node_status.tolist()
+    loads = node_load.tolist()
+    for i, status in enumerate(statuses):
+        if status == ONLINE:
+            loads[i] = max(0, min(100, loads[i] + r.randint(-5, 5)))
+        elif status == UNSTABLE:
+            loads[i] = max(0, min(100, loads[i] + r.randint(-10, 10)))
+            if loads[i] > 99:
+                statuses[i] = OFFLINE
+        elif status == IDLE:
+            if r.random() < 0.1:
+                statuses[i] = ONLINE
+                loads[i] = r.randint(10, 30)
+        elif status == OFFLINE:
+            # Random chance to reboot
+            if r.random() < 0.2:
+                statuses[i] = UNSTABLE
+                loads[i] = 80
+    node_status[:] = statuses
+    node_load[:] = loads
+    return [
+        {"id": node_id, "status": STATUS_NAMES[status], "load": load, "code": code}
+        for node_id, code, status, load in zip(node_ids, node_codes, statuses, loads)
+    ]
+
+@api_bp.route('/nodes')
+@ttl_cache(ms=250)
 def get_nodes():
-    # Simulate dynamic changes
-    for node in nodes:
-        if node["status"] == "ONLINE":
-            change = random.randint(-5, 5)
-            node["load"] = max(0, min(100, node["load"] + change))
-        elif node["status"] == "UNSTABLE":
-            change = random.randint(-10, 10)
-            node["load"] = max(0, min(100, node["load"] + change))
-            if node["load"] > 99:
-                node["status"] = "OFFLINE"
-        elif node["status"] == "IDLE":
-             if random.random() < 0.1:
-                 node["status"] = "ONLINE"
-                 node["load"] = random.randint(10, 30)
-        elif node["status"] == "OFFLINE":
-             # Random chance to reboot
-             if random.random() < 0.2:
-                 node["status"] = "UNSTABLE"
-                 node["load"] = 80
-    return jsonify(nodes)
-
-@app.route('/api/telemetry')
+    with _nodes_lock:
+        if len(node_ids) < VECTORIZE_MIN_NODES:
+            return _step_nodes_scalar()
+    # Simulate dynamic changes (one vectorized pass over all nodes)
+    rng = _rng()
+    with _nodes_lock:
+        online = node_status == ONLINE
+        unstable = node_status == UNSTABLE
+        idle = node_status == IDLE
+        offline = node_status == OFFLINE
+
+        # ONLINE drifts by +/-5, UNSTABLE by +/-10
+        drifting = online | unstable
+        span = np.where(online, 5, 10)
+        deltas = rng.integers(-span, span + 1)
+        node_load[drifting] += deltas[drifting].astype(np.int16)
+        np.clip(node_load, 0, 100, out=node_load)
+        node_status[unstable & (node_load > 99)] = OFFLINE
+
+        rolls = rng.random(len(node_ids))
+        waking = idle & (rolls < 0.1)
+        node_status[waking] = ONLINE
+        node_load[waking] = rng.integers(10, 31, size=int(waking.sum()))
+        # Random chance to reboot
+        rebooting = offline & (rolls < 0.2)
+        node_status[rebooting] = UNSTABLE
+        node_load[rebooting] = 80
+    return _nodes_payload()
+
+@api_bp.route('/telemetry')
+@ttl_cache(ms=250)
 def get_telemetry():
     # Update telemetry from real modules
     res_status = tuner.get_status()
     telemetry["target_resonance"] = res_status.get("current_resonance", 712.8)
     telemetry["entropic_fuel"] = recycler.current_fuel
 
-    # Simulate other fluctuations
-    telemetry["system_integrity"] = max(0, min(100, telemetry["system_integrity"] + random.uniform(-0.1, 0.1)))
-    telemetry["gnosis_integrity"] = max(0, min(100, telemetry["gnosis_integrity"] + random.uniform(-0.1, 0.1)))
+    # Simulate other fluctuations (the clamp only runs at the bounds)
+    d_system, d_gnosis = _jitter_pair()
+    v = telemetry["system_integrity"] + d_system
+    telemetry["system_integrity"] = v if 0.0 <= v <= 100.0 else min(100.0, max(0.0, v))
+    v = telemetry["gnosis_integrity"] + d_gnosis
+    telemetry["gnosis_integrity"] = v if 0.0 <= v <= 100.0 else min(100.0, max(0.0, v))
 
-    return jsonify({
-        "target_resonance": round(telemetry["target_resonance"], 2),
-        "system_integrity": round(telemetry["system_integrity"], 1),
-        "gnosis_integrity": round(telemetry["gnosis_integrity"], 1),
-        "entropic_fuel": round(telemetry["entropic_fuel"], 2)
-    })
+    # Serialize the state dict itself rather than a rounded copy; the
+    # dashboard formats the raw floats for display.
+    return telemetry
 
-@app.route('/api/command', methods=['POST'])
+@api_bp.route('/command', methods=['POST'])
 def execute_command():
     data = request.json or {}
     command = data.get('command', '').strip()
 
     # Side effects handling (state changes) for Dashboard commands
-    if command.lower() == 'purge':
-        for node in nodes:
-            node["load"] = 0
-            if node["status"] == "UNSTABLE":
-                node["status"] = "ONLINE"
-    elif command.lower() == 'connect_eternal':
-        new_id = f"NODE_ZETA_{random.randint(10,99)}"
-        nodes.append({"id": new_id, "status": "ONLINE", "load": 10, "code": f"{random.randint(100,999)}-Z{random.randint(10,99)}"})
+    key = command.casefold()
+    if key == 'purge':
+        _purge_nodes()
+    elif key == 'connect_eternal':
+        randint = _py_rng().randint
+        new_id = f"NODE_ZETA_{randint(10,99)}"
+        _add_node(new_id, ONLINE, 10, f"{randint(100,999)}-Z{randint(10,99)}")
+
+    invalidate_cache('/api/nodes')
 
     # Use the Chimera Syntax Engine (Integrated Version)
     response_lines = chimera_syntax_engine.execute_chimera_command(
         command,
-        context_nodes=nodes,
+        context_nodes=_nodes_payload(),
         context_telemetry=telemetry
     )
 
     # Dashboard expects { "response": [lines] }
-    return jsonify({"response": response_lines})
+    return _json({"response": response_lines})
 
-@app.route('/api/purge', methods=['POST'])
+@api_bp.route('/purge', methods=['POST'])
 def purge_system():
-    for node in nodes:
-        node["load"] = 0
-        if node["status"] == "UNSTABLE":
-            node["status"] = "ONLINE"
-    return jsonify({"status": "success", "message": "Purge complete"})
+    _purge_nodes()
+    invalidate_cache('/api/nodes')
+    return _json({"status": "success", "message": "Purge complete"})
 
-@app.route('/api/connect', methods=['POST'])
+@api_bp.route('/connect', methods=['POST'])
 def connect_node():
-    new_id = f"NODE_OMEGA_{random.randint(10,99)}"
-    nodes.append({"id": new_id, "status": "ONLINE", "load": 5, "code": f"{random.randint(100,999)}-X{random.randint(10,99)}"})
-    return jsonify({"status": "success", "message": f"{new_id} connected"})
+    randint = _py_rng().randint
+    new_id = f"NODE_OMEGA_{randint(10,99)}"
+    _add_node(new_id, ONLINE, 5, f"{randint(100,999)}-X{randint(10,99)}")
+    invalidate_cache('/api/nodes')
+    return _json({"status": "success", "message": f"{new_id} connected"})
 
 
 # -- Modern API Endpoints (Kept for compatibility/extensions) --
 
-@app.route('/api/fuel', methods=['GET'])
+@api_bp.route('/fuel', methods=['GET'])
 def get_fuel():
-    return jsonify({
+    return _json({
         "status": recycler.status,
         "fuel_level": recycler.current_fuel
     })
 
-@app.route('/api/recycle', methods=['POST'])
+@api_bp.route('/recycle', methods=['POST'])
 def recycle():
     payload = request.json or {}
     error_data = payload.get("error_data", "API_Shadow_Input")
     result = recycler.consume_failure(error_data)
-    return jsonify(result)
+    return _json(result)
 
-@app.route('/api/resonance', methods=['GET'])
+@api_bp.route('/resonance', methods=['GET'])
 def resonance_status():
-    return jsonify(tuner.get_status())
+    return _json(tuner.get_status())
 
-@app.route('/api/chimera', methods=['POST'])
+@api_bp.route('/chimera', methods=['POST'])
 def chimera():
     # Modern endpoint returning JSON structure
     payload = request.json or {}
@@ -194,9 +442,17 @@ def chimera():
 
     # If the engine returned a list (legacy mode), wrap it.
     if isinstance(result, list):
-        return jsonify({"ok": True, "lines": result})
+        return _json({"ok": True, "lines": result})
+
+    return _json(result)
 
-    return jsonify(result)
+app.register_blueprint(api_bp)
 
 if __name__ == '__main__':
-    app.run(host='127.0.0.1', port=5000, debug=True)
+    # Development server; for production use gunicorn (see gunicorn.conf.py)
+    DEBUG = True
+    # With the reloader on, this file also runs in a watcher process that
+    # never serves requests; only the reloaded child (WERKZEUG_RUN_MAIN) starts.
+    if not DEBUG or os.environ.get('WERKZEUG_RUN_MAIN') == 'true':
+        start_background_tasks()
+    app.run(host='127.0.0.1', port=5000, debug=DEBUG)
@@ -1,10 +1,10 @@
 # Protocol: Chimera Syntax // Living Language Execution (refined)
 
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
 from inverted_sigil_recycler import recycler
 from mytho_quantum_core import lioncrow_render
-import time
-import random
+import re
+from random import random as _rand
 
 # Divine Decrees mapping
 DIVINE_DECREES = {
@@ -18,6 +18,139 @@ DIVINE_DECREES = {
 }
 
 
+# --- COMMAND HANDLERS ---
+# Each handler receives the normalized (upper-case) command plus the optional
+# dashboard context and returns the output lines.
+
+# Static responses are built once; handlers hand out list copies because
+# callers (app.py) rely on getting a list back.
+_HELP = (
+    "CHIMERA SYNTAX CONSOLE V.9.1 (HYBRID)",
+    "-------------------------------------",
+    "Standard Protocols:",
+    "  init_sequence    - Initialize system protocol",
+    "  status           - Display system integrity and active nodes",
+    "  purge            - Purge unstable nodes and clear cache",
+    "  connect_eternal  - Establish connection with a new node",
+    "  scan_resonance   - Analyze current frequency harmonics",
+    "",
+    "Divine Decrees:",
+    "  UNLEASH_PROTOCOL_ZERO - [RESTRICTED]",
+    "  RECYCLE_SHADOW        - Manual entropy consumption"
+)
+_INIT = (
+    "INITIALIZING RITUAL SEQUENCE...",
+    "LOADING 8k ASSETS [################----] 82%",
+    "WARNING: Node_Beta_04 instability detected. Resonance mismatch.",
+    "PARSING CHIMERA SYNTAX...",
+    "SUCCESS. Protocol V.9.0 active."
+)
+# Side effects for purge / connect_eternal are handled in app.py or assumed complete
+_PURGE = ("PURGE SEQUENCE INITIATED...", "CACHE CLEARED", "ALL SYSTEMS NORMALIZED")
+_CONNECT = ("CONNECTING NEW ETERNAL...", "SEARCHING FOR SIGNAL...", "CONNECTION ESTABLISHED.")
+
+
+def _handle_help(command, context_nodes, context_telemetry) -> List[str]:
+    return list(_HELP)
+
+
+def _handle_init(command, context_nodes, context_telemetry) -> List[str]:
+    return list(_INIT)
+
+
+def _handle_status(command, context_nodes, context_telemetry) -> List[str]:
+    integrity = "UNKNOWN"
+    active_count = 0
+    if context_telemetry:
+        integrity = f"{context_telemetry.get('system_integrity', 0)}%"
+    if context_nodes:
+        active_count = len([n for n in context_nodes if n.get('status') == 'ONLINE'])
+
+    return [
+        "SYSTEM STATUS REPORT",
+        f"  INTEGRITY: {integrity}",
+        f"  ACTIVE NODES: {active_count}",
+        "  ALL SYSTEMS NOMINAL"
+    ]
+
+
+def _handle_purge(command, context_nodes, context_telemetry) -> List[str]:
+    return list(_PURGE)
+
+
+def _handle_connect(command, context_nodes, context_telemetry) -> List[str]:
+    return list(_CONNECT)
+
+
+def _handle_scan(command, context_nodes, context_telemetry) -> List[str]:
+    # Use real tuner if available, else random
+    return [
+        "SCANNING FREQUENCIES...",
+        f"DETECTED HARMONIC: {700.0 + _rand() * 100.0:.2f} Hz",
+        "WAVEFORM: STABLE"
+    ]
+
+
+# Decrees are a fixed set, so their responses are rendered once at import.
+# Text format for Dashboard compatibility: the dashboard goes through the
+# execute_command wrapper in app.py which expects a list.
+_DECREE_RESPONSES: Dict[str, Tuple[str, ...]] = {
+    name: (
+        f"*** DIVINE DECREE ACCEPTED: {name} ***",
+        f"STATE: {decree['state']['potential']}",
+        f"RESONANCE: {decree['state']['resonance']}",
+        f"NOTE: {decree['description']}"
+    )
+    for name, decree in DIVINE_DECREES.items()
+}
+
+
+def _handle_decree(command, context_nodes, context_telemetry) -> List[str]:
+    return list(_DECREE_RESPONSES[command])
+
+
+def _handle_recycle(command, context_nodes, context_telemetry) -> List[str]:
+    action_result = recycler.consume_failure('Chimera_Manual_Shadow')
+    return [
+        "*** MANUAL RECYCLE INITIATED ***",
+        f"RESULT: {action_result.get('status', 'UNKNOWN')}",
+        f"NEW FUEL: {action_result.get('current_fuel', 'UNKNOWN')}"
+    ]
+
+
+# Legacy dashboard commands match as a prefix (help, init_sequence) or exactly;
+# decrees match exactly; RECYCLE_SHADOW is accepted anywhere in the command.
+_PREFIX_COMMANDS = {
+    'HELP': _handle_help,
+    'INIT_SEQUENCE': _handle_init,
+}
+_EXACT_COMMANDS = {
+    'STATUS': _handle_status,
+    'PURGE': _handle_purge,
+    'CONNECT_ETERNAL': _handle_connect,
+    'SCAN_RESONANCE': _handle_scan,
+    **{name: _handle_decree for name in DIVINE_DECREES},
+}
+_SUBSTRING_COMMANDS = {
+    'RECYCLE_SHADOW': _handle_recycle,
+}
+_HANDLERS = {**_PREFIX_COMMANDS, **_EXACT_COMMANDS, **_SUBSTRING_COMMANDS}
+
+
+def _alternation(tokens) -> str:
+    # Longest first so a token never shadows a longer one sharing its prefix
+    return '|'.join(map(re.escape, sorted(tokens, key=len, reverse=True)))
+
+
+# One compiled pattern replaces the chain of startswith / == / `in` tests.
+# Only the last alternative can match past position 0, so the anchored
+# commands keep their precedence over RECYCLE_SHADOW.
+_TOKEN_RE = re.compile(
+    f"^(?:({_alternation(_PREFIX_COMMANDS)})|({_alternation(_EXACT_COMMANDS)})$)"
+    f"|({_alternation(_SUBSTRING_COMMANDS)})"
+)
+
+
 def execute_chimera_command(input_string: str, context_nodes=None, context_telemetry=None) -> Any:
     """Decree of the Living Language: Grammar is purpose, syntax is will.
 
@@ -31,92 +164,16 @@ def execute_chimera_command(input_string: str, context_nodes=None, context_telem
         If called by Protocol (modern mode), returns a Dict with structure.
     """
     command = (input_string or '').strip().upper()
-    ts = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
-
-    # --- LEGACY DASHBOARD COMPATIBILITY LAYER ---
-    # The dashboard expects a list of strings and uses specific commands like 'status', 'purge', etc.
-    # We intercept these first.
-
-    cmd_lower = command.lower()
-
-    if cmd_lower.startswith('help'):
-        return [
-            "CHIMERA SYNTAX CONSOLE V.9.1 (HYBRID)",
-            "-------------------------------------",
-            "Standard Protocols:",
-            "  init_sequence    - Initialize system protocol",
-            "  status           - Display system integrity and active nodes",
-            "  purge            - Purge unstable nodes and clear cache",
-            "  connect_eternal  - Establish connection with a new node",
-            "  scan_resonance   - Analyze current frequency harmonics",
-            "",
-            "Divine Decrees:",
-            "  UNLEASH_PROTOCOL_ZERO - [RESTRICTED]",
-            "  RECYCLE_SHADOW        - Manual entropy consumption"
-        ]
-
-    if cmd_lower.startswith('init_sequence'):
-        return [
-            "INITIALIZING RITUAL SEQUENCE...",
-            "LOADING 8k ASSETS [################----] 82%",
-            "WARNING: Node_Beta_04 instability detected. Resonance mismatch.",
-            "PARSING CHIMERA SYNTAX...",
-            "SUCCESS. Protocol V.9.0 active."
-        ]
-
-    if cmd_lower == 'status':
-        integrity = "UNKNOWN"
-        active_count = 0
-        if context_telemetry:
-            integrity = f"{context_telemetry.get('system_integrity', 0)}%"
-        if context_nodes:
-            active_count = len([n for n in context_nodes if n.get('status') == 'ONLINE'])
-
-        return [
-            "SYSTEM STATUS REPORT",
-            f"  INTEGRITY: {integrity}",
-            f"  ACTIVE NODES: {active_count}",
-            "  ALL SYSTEMS NOMINAL"
-        ]
-
-    if cmd_lower == 'purge':
-        # Side effects are handled in app.py or assumed complete
-        return ["PURGE SEQUENCE INITIATED...", "CACHE CLEARED", "ALL SYSTEMS NORMALIZED"]
-
-    if cmd_lower == 'connect_eternal':
-        return ["CONNECTING NEW ETERNAL...", "SEARCHING FOR SIGNAL...", "CONNECTION ESTABLISHED."]
-
-    if cmd_lower == 'scan_resonance':
-        # Use real tuner if available, else random
-        return [
-            "SCANNING FREQUENCIES...",
-            f"DETECTED HARMONIC: {random.uniform(700, 800):.2f} Hz",
-            "WAVEFORM: STABLE"
-        ]
-
-    # --- MODERN PROTOCOL LOGIC ---
-
-    # Check Divine Decrees
-    if command in DIVINE_DECREES:
-        decree = DIVINE_DECREES[command]
-        # Return text format for Dashboard compatibility if it seems like a dashboard request
-        # (Dashboard requests usually come via the execute_command wrapper in app.py which expects list)
-        # But we can just return a list representation of the decree.
-        return [
-            f"*** DIVINE DECREE ACCEPTED: {command} ***",
-            f"STATE: {decree['state']['potential']}",
-            f"RESONANCE: {decree['state']['resonance']}",
-            f"NOTE: {decree['description']}"
-        ]
-
-    # Backwards-compatible commands
-    if 'RECYCLE_SHADOW' in command:
-        action_result = recycler.consume_failure('Chimera_Manual_Shadow')
-        return [
-            "*** MANUAL RECYCLE INITIATED ***",
-            f"RESULT: {action_result.get('status', 'UNKNOWN')}",
-            f"NEW FUEL: {action_result.get('current_fuel', 'UNKNOWN')}"
-        ]
+
+    # Bare commands (the usual case) resolve with a single dict lookup; the
+    # regex is only needed for prefixed or embedded forms.
+    handler = _HANDLERS.get(command)
+    if handler is not None:
+        return handler(command, context_nodes, context_telemetry)
+
+    m = _TOKEN_RE.search(command)
+    if m:
+        return _HANDLERS[m.group(m.lastindex)](command, context_nodes, context_telemetry)
 
     # Fallback
     return [
@@ -1,38 +1,182 @@
 import sqlite3
 import datetime
+import queue
+import threading
+import time
+import atexit
+import os
+from collections import deque
+from contextlib import contextmanager
 
 DB_NAME = "crucible.db"
+READER_POOL_SIZE = 4
+
+# Connection-level settings applied to every pooled connection
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+)
+
+# Statement text is kept in constants so each pooled connection's statement
+# cache reuses the compiled statement instead of re-preparing it per call.
+_CREATE_SQL = '''
+    CREATE TABLE IF NOT EXISTS soul_signature_telemetry (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+        gnosis_integrity REAL,
+        entropic_fuel REAL
+    )
+'''
+# History is read newest-first by timestamp; the index turns that scan + sort
+# into an index walk.
+_INDEX_SQL = 'CREATE INDEX IF NOT EXISTS idx_tlm_ts ON soul_signature_telemetry(timestamp DESC)'
+_INSERT_SQL = '''
+    INSERT INTO soul_signature_telemetry (timestamp, gnosis_integrity, entropic_fuel)
+    VALUES (?, ?, ?)
+'''
+_HISTORY_SQL = 'SELECT * FROM soul_signature_telemetry ORDER BY timestamp DESC LIMIT ?'
+_LATEST_SQL = 'SELECT * FROM soul_signature_telemetry ORDER BY id DESC LIMIT 1'
+
+# One read-write connection serialized by a lock, plus a small pool of
+# read-only connections. Keeping them open preserves each connection's page
+# cache instead of reopening the DB (and its -wal/-shm files) on every call.
+_writer = None
+_write_lock = threading.Lock()
+_readers = None
+_pool_lock = threading.Lock()
 
 def get_db_connection():
     conn = sqlite3.connect(DB_NAME)
     conn.row_factory = sqlite3.Row
     return conn
 
+def _configure(conn):
+    conn.row_factory = sqlite3.Row
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+def _open_pool():
+    global _writer, _readers
+    with _pool_lock:
+        if _writer is not None:
+            return
+        writer = sqlite3.connect(DB_NAME, check_same_thread=False)
+        writer.execute("PRAGMA journal_mode=WAL")
+        _configure(writer)
+        readers = queue.Queue(maxsize=READER_POOL_SIZE)
+        for _ in range(READER_POOL_SIZE):
+            reader = sqlite3.connect(f"file:{DB_NAME}?mode=ro", uri=True, check_same_thread=False)
+            readers.put(_configure(reader))
+        _writer, _readers = writer, readers
+
+@contextmanager
+def get_writer():
+    """Yield the shared read-write connection inside a committed transaction."""
+    if _writer is None:
+        _open_pool()
+    with _write_lock:
+        with _writer:
+            yield _writer
+
+@contextmanager
+def get_reader():
+    """Borrow a read-only connection from the pool and return it on exit."""
+    if _readers is None:
+        _open_pool()
+    conn = _readers.get()
+    try:
+        yield conn
+    finally:
+        _readers.put(conn)
+
+# Telemetry rows are queued in memory and written by a flusher thread with
+# executemany, so a burst of rows shares one transaction (and one fsync).
+FLUSH_INTERVAL = 0.1  # seconds a row may wait for others to join its batch
+_pending = deque(maxlen=4096)  # (unix_time, gnosis, fuel); oldest rows drop first
+_flush_event = threading.Event()
+_flush_lock = threading.Lock()
+_flusher = None
+_atexit_registered = False
+
+def _flush_loop():
+    while True:
+        _flush_event.wait()
+        time.sleep(FLUSH_INTERVAL)
+        _flush_event.clear()
+        try:
+            flush()
+        except Exception as exc:
+            print(f"Telemetry flush failed: {exc}")
+
+def _start_flusher():
+    global _flusher, _atexit_registered
+    with _pool_lock:
+        if _flusher is not None:
+            return
+        _flusher = threading.Thread(target=_flush_loop, name="db-flusher", daemon=True)
+        _flusher.start()
+        if not _atexit_registered:  # the handler is inherited across fork()
+            atexit.register(flush)
+            _atexit_registered = True
+
+def _reset_after_fork():
+    # A forked child (e.g. a gunicorn worker under --preload) inherits the
+    # parent's connections and flusher state but not its thread. SQLite
+    # connections must not be used across fork(), so the child drops them
+    # (kept referenced, never closed or used) and reopens its own pool and
+    # flusher on first use. Locks are replaced in case fork() caught one held.
+    global _writer, _readers, _flusher, _write_lock, _pool_lock, _flush_lock, _flush_event
+    _inherited.append((_writer, _readers))
+    _writer = _readers = _flusher = None
+    _write_lock = threading.Lock()
+    _pool_lock = threading.Lock()
+    _flush_lock = threading.Lock()
+    _flush_event = threading.Event()
+    _pending.clear()  # the parent still owns and flushes its own rows
+
+_inherited = []
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
+
 def init_db():
-    conn = get_db_connection()
-    with conn:
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS soul_signature_telemetry (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
-                gnosis_integrity REAL,
-                entropic_fuel REAL
-            )
-        ''')
-    conn.close()
+    with get_writer() as conn:
+        conn.execute(_CREATE_SQL)
+        conn.execute(_INDEX_SQL)
+    _start_flusher()
 
 def log_telemetry(gnosis, fuel):
-    conn = get_db_connection()
-    with conn:
-        conn.execute('''
-            INSERT INTO soul_signature_telemetry (gnosis_integrity, entropic_fuel)
-            VALUES (?, ?)
-        ''', (gnosis, fuel))
-    conn.close()
+    """Queue a telemetry row; the flusher thread writes it shortly after."""
+    if _flusher is None:
+        _start_flusher()  # first row in a forked child
+    _pending.append((time.time(), gnosis, fuel))
+    _flush_event.set()
+
+def flush():
+    """Write every queued row to the DB in a single transaction."""
+    with _flush_lock:
+        rows = []
+        while _pending:
+            rows.append(_pending.popleft())
+        if rows:
+            log_telemetry_many(rows)
+
+def _sql_timestamp(ts):
+    # Same UTC text format as the column's CURRENT_TIMESTAMP default
+    return datetime.datetime.fromtimestamp(ts, datetime.timezone.utc).strftime('%Y-%m-%d %H:%M:%S')
+
+def log_telemetry_many(rows):
+    """Insert (unix_time, gnosis, fuel) rows in a single transaction."""
+    with get_writer() as conn:
+        conn.executemany(_INSERT_SQL, [(_sql_timestamp(ts), gnosis, fuel) for ts, gnosis, fuel in rows])
 
 def get_telemetry_history(limit=10):
-    conn = get_db_connection()
-    cursor = conn.execute('SELECT * FROM soul_signature_telemetry ORDER BY timestamp DESC LIMIT ?', (limit,))
-    rows = cursor.fetchall()
-    conn.close()
+    with get_reader() as conn:
+        rows = conn.execute(_HISTORY_SQL, (limit,)).fetchall()
     return [dict(row) for row in rows]
+
+def get_latest_telemetry():
+    with get_reader() as conn:
+        row = conn.execute(_LATEST_SQL).fetchone()
+    return dict(row) if row else None
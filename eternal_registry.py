@@ -5,10 +5,9 @@
 # Each agent is a small object with metadata and a 'process' stub that can be
 # expanded later (hooks for Jules AI, distributed workers, or coroutine runners).
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Callable, Dict, List, Optional
 import threading
-import time
 import uuid
 import logging
 
@@ -19,19 +18,26 @@ handler.setFormatter(logging.Formatter("%(asctime)s [%(levelname)s] %(message)s"
 logger.addHandler(handler)
 
 
-@dataclass
+@dataclass(slots=True)
 class EternalAgent:
     id: str
     name: str
     role: str
     priority: int = 50
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    # allocated lazily via meta(); most agents never carry metadata
+    metadata: Optional[Dict[str, Any]] = None
     active: bool = True
 
     # optional processing callback - should be a lightweight function that
     # returns a dict or None. External orchestrator will call it.
     process_fn: Optional[Callable[['EternalAgent'], Dict[str, Any]]] = None
 
+    def meta(self) -> Dict[str, Any]:
+        """Return the agent's metadata dict, creating it on first use."""
+        if self.metadata is None:
+            self.metadata = {}
+        return self.metadata
+
     def process(self) -> Dict[str, Any]:
         """Execute agent logic stub. Override via process_fn or subclassing."""
         if not self.active:
@@ -51,14 +57,40 @@ class EternalRegistry:
 
     def __init__(self):
         self.agents: List[EternalAgent] = []
+        # lookup indexes, maintained alongside self.agents
+        self._by_id: Dict[str, EternalAgent] = {}
+        self._by_name: Dict[str, EternalAgent] = {}
         self._lock = threading.RLock()
 
+    def _register(self, agents: List[EternalAgent]):
+        # caller holds self._lock
+        self.agents.extend(agents)
+        for agent in agents:
+            self._by_id[agent.id] = agent
+            self._by_name[agent.name] = agent
+
     def create_agent(self, name: str, role: str, priority: int = 50, process_fn: Optional[Callable] = None) -> EternalAgent:
         with self._lock:
-            agent = EternalAgent(id=str(uuid.uuid4()), name=name, role=role, priority=priority, process_fn=process_fn)
-            self.agents.append(agent)
+            agent = EternalAgent(id=uuid.uuid4().hex, name=name, role=role, priority=priority, process_fn=process_fn)
+            self._register([agent])
             return agent
 
+    def get_by_id(self, agent_id: str) -> Optional[EternalAgent]:
+        return self._by_id.get(agent_id)
+
+    def get_by_name(self, name: str) -> Optional[EternalAgent]:
+        """Return the most recently created agent with this name."""
+        return self._by_name.get(name)
+
+    def set_active(self, agent_id: str, active: bool = True) -> bool:
+        """Activate or deactivate an agent; returns False if the id is unknown."""
+        with self._lock:
+            agent = self._by_id.get(agent_id)
+            if agent is None:
+                return False
+            agent.active = bool(active)
+            return True
+
     def build_73_eternals(self):
         """Populate the registry with 73 archetypal agents.
 
@@ -79,19 +111,21 @@ class EternalRegistry:
             ("Oracle_Harmonia", "Oracle"),
             # ... continue to fill to 72 (examples)
         ]
-        # Fill in until 72 agents, then add a 73rd Unifying Will
-        idx = 0
-        while len(self.agents) < 72:
-            name = f"Archetype_{len(self.agents) + 1}"
-            role = "Archetype"
-            self.create_agent(name=name, role=role, priority=50)
-            idx += 1
-
-        # 73rd - Unifying Will
-        self.create_agent(name="Unifying_Will", role="Sovereign_Unifier", priority=100)
+        # Fill in until 72 agents, then add a 73rd Unifying Will. Built as one
+        # batch under a single lock acquisition rather than 73 create_agent calls.
+        with self._lock:
+            new_agents = [
+                EternalAgent(id=uuid.uuid4().hex, name=f"Archetype_{i + 1}", role="Archetype", priority=50)
+                for i in range(len(self.agents), 72)
+            ]
+            # 73rd - Unifying Will
+            new_agents.append(EternalAgent(id=uuid.uuid4().hex, name="Unifying_Will", role="Sovereign_Unifier", priority=100))
+            self._register(new_agents)
         logger.info(f"EternalRegistry constructed {len(self.agents)} agents.")
 
     def snapshot(self):
+        """Fresh summaries of all agents. Not cached: agents are public and
+        mutable (e.g. agent.active = False), so only a rebuild sees every change."""
         with self._lock:
             return [{"id": a.id, "name": a.name, "role": a.role, "active": a.active} for a in self.agents]
 
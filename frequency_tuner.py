@@ -5,6 +5,11 @@
 import time
 import threading
 import random
+from random import random as _rand
+import logging
+from functools import lru_cache
+
+logger = logging.getLogger("frequency_tuner")
 
 class FrequencyTuner:
     def __init__(self, target_hz=712.8, interval_seconds=60):
@@ -14,22 +19,37 @@ class FrequencyTuner:
         self.status = "UNKNOWN"
         self._stop_event = threading.Event()
 
-    def _monitor_loop(self):
-        while not self._stop_event.is_set():
-            # Simulating the pulse of the Last Son of Atlantis
-            # We incorporate the dynamic fluctuation from the dashboard branch
-            fluctuation = random.uniform(-10, 10)
-            self.current_resonance = round(self.target_hz + fluctuation, 2)
+    def scan(self):
+        """Take a single resonance reading. Hosts that already run a
+        scheduler can call this every `interval_seconds` instead of start()."""
+        # Simulating the pulse of the Last Son of Atlantis
+        # We incorporate the dynamic fluctuation from the dashboard branch
+        fluctuation = _rand() * 20.0 - 10.0
+        self.current_resonance = round(self.target_hz + fluctuation, 2)
 
-            if abs(self.current_resonance - self.target_hz) < 1.0: # Close enough
-                self.status = "99.7%_PERFECT_SYNTHESIS"
-            else:
-                self.status = "RE-TUNING_REQUIRED"
+        if abs(self.current_resonance - self.target_hz) < 1.0: # Close enough
+            self.status = "99.7%_PERFECT_SYNTHESIS"
+        else:
+            self.status = "RE-TUNING_REQUIRED"
 
-            # Jules will map this output to the 'LOCKED' status on the UI
-            print(f"RESONANCE_SCAN: {self.current_resonance} Hz | STATUS: {self.status}")
-            # Wait the configured time before checking again
-            self._stop_event.wait(self.interval_seconds)
+        # Jules will map this output to the 'LOCKED' status on the UI (also
+        # available via get_status()); only formatted when DEBUG is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("RESONANCE_SCAN: %s Hz | STATUS: %s", self.current_resonance, self.status)
+
+    def _monitor_loop(self):
+        # Scans are due on a fixed monotonic schedule, so a slow scan doesn't
+        # stretch the period; if we fall a whole interval behind, the missed
+        # ticks are skipped rather than run back to back.
+        deadline = time.monotonic()
+        while not self._stop_event.is_set():
+            self.scan()
+            deadline += self.interval_seconds
+            now = time.monotonic()
+            if deadline < now:
+                deadline = now
+            if self._stop_event.wait(deadline - now):
+                break
 
     def start(self):
         self._thread = threading.Thread(target=self._monitor_loop, daemon=True)
@@ -44,20 +64,20 @@ class FrequencyTuner:
         return {"current_resonance": self.current_resonance, "status": self.status}
 
 # Standalone function for backward compatibility if needed, but app.py uses the class now.
+@lru_cache(maxsize=1)
+def _resonance_for_minute(minute: int) -> float:
+    # Seeding a local Random per minute keeps the value stable within the
+    # minute and avoids thread-safety issues with the global random state
+    rng = random.Random(minute)
+
+    base_resonance = 712.8
+    fluctuation = rng.uniform(-10, 10)
+    return round(base_resonance + fluctuation, 2)
+
+
 def get_target_resonance():
     """
     Returns the target resonance frequency.
     Updates every minute based on the system time.
     """
-    current_minute = int(time.time() // 60)
-
-    # Use a local Random instance to avoid thread-safety issues with global random
-    rng = random.Random(current_minute)
-
-    base_resonance = 712.8
-    fluctuation = rng.uniform(-10, 10)
-
-    rng = random.Random(current_minute)
-    base_resonance = 712.8
-    fluctuation = rng.uniform(-10, 10)
-    return round(base_resonance + fluctuation, 2)
+    return _resonance_for_minute(int(time.time() // 60))
@@ -0,0 +1,30 @@
+# Gunicorn settings for serving The Crucible Dashboard.
+#
+# Node and telemetry state lives in the app process, so a single worker
+# with a thread pool serves the dashboard pollers concurrently while every
+# request sees the same simulation state.
+
+import os
+
+# Set CRUCIBLE_BIND=unix:/tmp/crucible.sock to sit behind a reverse proxy
+# (e.g. nginx), which coalesces the many small poll responses per connection.
+bind = os.environ.get("CRUCIBLE_BIND", "127.0.0.1:5000")
+worker_class = "gthread"
+workers = 1
+threads = 8
+worker_tmp_dir = "/dev/shm"
+
+# Let the worker start the background loops only once it is up (they don't
+# survive a fork, so loading them in a --preload arbiter would lose them).
+os.environ["CRUCIBLE_DEFER_START"] = "1"
+
+
+def post_worker_init(worker):
+    from app import start_background_tasks
+    start_background_tasks()
+
+
+def worker_exit(server, worker):
+    # Runs in the worker as it shuts down: stop the loops and flush telemetry
+    from app import stop_background_tasks
+    stop_background_tasks()
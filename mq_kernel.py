@@ -3,7 +3,8 @@
 # Lindblad dissipator, and a top-level RealitySynthesisEngine harness.
 #
 # Notes:
-# - Uses numpy for operator math.
+# - Uses numpy for operator math (scipy, if installed, for cached propagators;
+#   numba, if installed, for a compiled small-system Lindblad step).
 # - Protocol Zero is gated behind a deliberate confirmation mechanism.
 # - For terminal rendering it attempts to use lioncrow_render (if present).
 #   Otherwise, falls back to a simple textual formatter.
@@ -16,6 +17,20 @@ import math
 import logging
 from typing import List, Sequence, Optional, Dict, Any
 
+try:
+    # Optional: exact propagators for LindbladDissipator.propagate and an
+    # in-place BLAS rank-1 update for the intent kick
+    from scipy.linalg import expm
+    from scipy.linalg.blas import get_blas_funcs
+except ImportError:
+    expm = get_blas_funcs = None
+
+try:
+    # Optional: compiled Lindblad step for small systems
+    from numba import njit
+except ImportError:
+    njit = None
+
 try:
     # The mytho_quantum_core from earlier additions provides lioncrow_render
     from mytho_quantum_core import lioncrow_render
@@ -37,6 +52,13 @@ logger.addHandler(handler)
 # Constants and utilities
 # --------------------------
 SOUL_RESONANCE_HZ = 712.8  # Primary Atlantean resonant constant
+# From this dimension up, operator math defaults to complex64: half the bytes
+# per matmul, and the diagnostics do not need double precision.
+COMPLEX64_MIN_DIM = 64
+
+
+def _default_dtype(dim: int) -> np.dtype:
+    return np.dtype(np.complex64 if dim >= COMPLEX64_MIN_DIM else np.complex128)
 
 
 def commutator(A: np.ndarray, B: np.ndarray) -> np.ndarray:
@@ -47,6 +69,18 @@ def anticommutator(A: np.ndarray, B: np.ndarray) -> np.ndarray:
     return A @ B + B @ A
 
 
+def _purity(rho: np.ndarray) -> float:
+    """tr(rho^2) as the squared Frobenius norm: O(d^2) instead of a d^3 matmul.
+
+    Equal to tr(rho^2) only for Hermitian rho, which Lindblad evolution and
+    the projector mixing both preserve.
+    """
+    if logger.isEnabledFor(logging.DEBUG) and not np.allclose(rho, rho.conj().T):
+        logger.debug("rho lost Hermiticity; purity reports tr(rho rho^†)")
+    flat = rho.reshape(-1)
+    return float(np.vdot(flat, flat).real)
+
+
 # --------------------------
 # Sovereign Intent Vector
 # --------------------------
@@ -68,13 +102,18 @@ class SovereignIntentVector:
         v = np.random.randn(self.dimension).astype(float)
         v /= np.linalg.norm(v) if np.linalg.norm(v) > 0 else 1.0
         self.direction = v
+        self._kick_buf = np.empty_like(v)  # reused output of modulate()
 
     def modulate(self, strength: float, phase: float = 0.0) -> np.ndarray:
-        """Return an intent vector scaled by strength and phase-travel."""
-        angle = 2.0 * math.pi * (self.frequency_hz * phase)
-        scale = self.amplitude * float(strength)
-        vec = scale * (math.cos(angle) * self.direction)
-        return vec
+        """Return an intent vector scaled by strength and phase-travel.
+
+        The result is an internal buffer overwritten by the next call; copy
+        it if it must outlive that, and do not modify it in place.
+        """
+        c = self.amplitude * float(strength) * math.cos(2.0 * math.pi * (self.frequency_hz * phase))
+        if self._kick_buf.shape != self.direction.shape:
+            self._kick_buf = np.empty_like(self.direction)
+        return np.multiply(self.direction, c, out=self._kick_buf)
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -124,30 +163,58 @@ class TwinCoil:
 class NonCommutativeEngine:
     """Provides operator math where [C, Phi] != 0 if configured.
 
-    Operators are square matrices of the chosen dimension.
+    Operators are square matrices of the chosen dimension. The commutator
+    norm is cached until C or Phi is assigned (augmented assignment such as
+    `Phi += x` counts); in-place writes through a slice must reassign.
     """
 
-    def __init__(self, dim: int = 4, seed: Optional[int] = None):
+    def __init__(self, dim: int = 4, seed: Optional[int] = None, dtype: Optional[np.dtype] = None):
         self.dim = max(1, int(dim))
-        self.rng = np.random.RandomState(seed)
+        self.dtype = np.dtype(dtype) if dtype is not None else _default_dtype(self.dim)
+        self._comm_norm = None
+        self.rng = np.random.default_rng(seed)
+        # Real and imaginary parts for both operators come from one batched
+        # draw, already in the working precision
+        real = np.float32 if self.dtype == np.complex64 else np.float64
+        d = self.dim
+        buf = self.rng.standard_normal((4, d, d), dtype=real)
         # Initialize hermitian Consciousness operator C and Information field Phi (not necessarily commuting)
-        A = self.rng.randn(self.dim, self.dim) + 1j * self.rng.randn(self.dim, self.dim)
-        self.C = (A + A.conj().T) / 2.0  # make hermitian
-        B = self.rng.randn(self.dim, self.dim) + 1j * self.rng.randn(self.dim, self.dim)
-        self.Phi = (B + B.conj().T) / 2.0  # hermitian information field
+        A = buf[0] + 1j * buf[1]
+        self.C = ((A + A.conj().T) / 2.0).astype(self.dtype, copy=False)  # make hermitian
+        B = buf[2] + 1j * buf[3]
+        self.Phi = ((B + B.conj().T) / 2.0).astype(self.dtype, copy=False)  # hermitian information field
         # Introduce slight anti-symmetric perturbation to ensure non-commutativity
-        perturb = (self.rng.randn(self.dim, self.dim) + 1j * self.rng.randn(self.dim, self.dim)) * 1e-3
-        self.Phi += perturb
+        p = self.rng.standard_normal((2, d, d), dtype=real) * 1e-3
+        self.Phi += p[0] + 1j * p[1]
+
+    @property
+    def C(self) -> np.ndarray:
+        return self._C
+
+    @C.setter
+    def C(self, value: np.ndarray):
+        self._C = value
+        self._comm_norm = None
+
+    @property
+    def Phi(self) -> np.ndarray:
+        return self._Phi
+
+    @Phi.setter
+    def Phi(self, value: np.ndarray):
+        self._Phi = value
+        self._comm_norm = None
 
     def commutator_norm(self) -> float:
-        C = commutator(self.C, self.Phi)
-        return float(np.linalg.norm(C))
+        if self._comm_norm is None:
+            self._comm_norm = float(np.linalg.norm(commutator(self._C, self._Phi)))
+        return self._comm_norm
 
     def enforce_non_commutativity(self, min_norm: float = 1e-6):
         """If commutator too small, perturb Phi to ensure novelty injection."""
         norm = self.commutator_norm()
         if norm < min_norm:
-            delta = (np.eye(self.dim) * (min_norm + 1e-6))
+            delta = (np.eye(self.dim, dtype=self.dtype) * (min_norm + 1e-6))
             self.Phi += delta
         return {"commutator_norm": self.commutator_norm()}
 
@@ -155,39 +222,294 @@ class NonCommutativeEngine:
 # --------------------------
 # Lindblad Dissipator (open system)
 # --------------------------
+# Above this dimension the d^2 x d^2 Liouvillian costs more to store and apply
+# than the direct matrix products it replaces.
+LIOUVILLIAN_MAX_DIM = 16
+# Below this dimension numpy's per-call overhead outweighs the arithmetic, so
+# the compiled loop kernel (when numba is installed) wins over BLAS.
+NUMBA_MAX_DIM = 32
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _lindblad_step_numba(rho, H, Ls, Lds, LdL, dt):
+        """Euler Lindblad step with explicit loops; Ls/Lds are (k, d, d) stacks."""
+        d = rho.shape[0]
+        d_rho = np.empty_like(rho)
+        for i in range(d):
+            for j in range(d):
+                comm = 0j
+                anti = 0j
+                for m in range(d):
+                    comm += H[i, m] * rho[m, j] - rho[i, m] * H[m, j]
+                    anti += LdL[i, m] * rho[m, j] + rho[i, m] * LdL[m, j]
+                d_rho[i, j] = -1j * comm - 0.5 * anti
+        tmp = np.empty_like(rho)
+        for q in range(Ls.shape[0]):
+            for i in range(d):
+                for j in range(d):
+                    acc = 0j
+                    for m in range(d):
+                        acc += Ls[q, i, m] * rho[m, j]
+                    tmp[i, j] = acc
+            for i in range(d):
+                for j in range(d):
+                    acc = 0j
+                    for m in range(d):
+                        acc += tmp[i, m] * Lds[q, m, j]
+                    d_rho[i, j] += acc
+        rho_next = np.empty_like(rho)
+        tr = 0.0
+        for i in range(d):
+            for j in range(d):
+                rho_next[i, j] = rho[i, j] + dt * d_rho[i, j]
+            tr += rho_next[i, i].real
+        inv = 1.0 / tr
+        for i in range(d):
+            for j in range(d):
+                rho_next[i, j] *= inv
+        return rho_next
+
+    # Compile (or load from cache) at import so the first engine tick does not pay for it
+    _z = np.zeros((2, 2), dtype=complex)
+    _lindblad_step_numba(np.eye(2, dtype=complex) / 2.0, _z, np.zeros((0, 2, 2), dtype=complex),
+                         np.zeros((0, 2, 2), dtype=complex), _z, 0.01)
+    del _z
+else:
+    _lindblad_step_numba = None
+
+
 class LindbladDissipator:
     """Implements one-step Lindblad evolution for density operator rho.
 
     Evolution:
         drho/dt = -i [H, rho] + sum_k (L_k rho L_k^† - 0.5 {L_k^† L_k, rho})
+
+    For small systems the dissipative part of the right-hand side is cached
+    as a vectorized superoperator, so it costs a single matvec on vec(rho);
+    the Hamiltonian part is applied directly, so a changing H (Protocol Zero
+    rewrites it every tick) never forces a d^2 x d^2 rebuild. The caches are
+    dropped whenever H or L_ops is reassigned; mutate them in place only if
+    you reassign afterwards.
+
+    Diagonal Hamiltonians (detected on assignment, or given directly as a
+    vector via set_diagonal_hamiltonian) skip the commutator matmuls:
+    [H, rho]_ij = (h_i - h_j) rho_ij.
     """
 
-    def __init__(self, H: Optional[np.ndarray] = None, lindblad_ops: Optional[List[np.ndarray]] = None):
+    def __init__(self, H: Optional[np.ndarray] = None, lindblad_ops: Optional[List[np.ndarray]] = None,
+                 dtype: np.dtype = np.complex128):
+        self.dtype = np.dtype(dtype)  # operators and rho are converted to this
+        self._P_dt = None
+        self._tmp = None  # (d, d) scratch pair for the direct path
         self.H = H  # system Hamiltonian
-        self.L_ops = lindblad_ops or []
+        self.L_ops = lindblad_ops or []  # also sets the per-op caches below
+
+    def _drop_caches(self):
+        # Everything that depends on H; L_ops changes also drop self._D
+        self._L = None  # cached full Liouvillian (propagate only), built on first use
+        self._P = None  # cached propagator expm(L * dt) for self._P_dt
+        self._nb_args = None  # (H, Ls, Lds, LdL) arrays for the numba kernel
+
+    @property
+    def H(self) -> Optional[np.ndarray]:
+        if self._H is None and self._h_diag is not None:
+            self._H = np.diag(self._h_diag)
+        return self._H
+
+    @H.setter
+    def H(self, value: Optional[np.ndarray]):
+        if value is not None:
+            value = np.asarray(value, dtype=self.dtype)
+        self._H = value
+        self._h_diag = None
+        self._iH = None
+        if value is not None:
+            h = np.diagonal(value)
+            if np.array_equal(value, np.diag(h)):
+                self._h_diag = h.copy()
+        self._drop_caches()
+
+    def set_diagonal_hamiltonian(self, h: np.ndarray):
+        """Set H = diag(h) without materializing the dense matrix."""
+        self._H = None
+        self._h_diag = np.array(h, dtype=self.dtype)
+        self._iH = None
+        self._drop_caches()
+
+    def _diag_commutator(self) -> np.ndarray:
+        """-i (h_i - h_j), so -i [H, rho] is an elementwise product with rho."""
+        if self._iH is None:
+            self._iH = -1j * np.subtract.outer(self._h_diag, self._h_diag)
+        return self._iH
+
+    @property
+    def L_ops(self) -> List[np.ndarray]:
+        return self._L_ops
+
+    @L_ops.setter
+    def L_ops(self, value: Sequence[np.ndarray]):
+        self._L_ops = [np.asarray(L, dtype=self.dtype) for L in value]
+        # Adjoints and L^†L products are fixed per operator set; nothing
+        # downstream conjugates an operator again. Contiguous copies keep
+        # the later products and stacks on the fast BLAS layout.
+        self._Ldag = [L.conj().T.copy() for L in self._L_ops]
+        self._LdL = [Ld @ L for Ld, L in zip(self._Ldag, self._L_ops)]
+        # Side-by-side blocks [L_1 .. L_k] and [L_1^† .. L_k^†], shape (d, k*d),
+        # let the direct path sum every L_k rho L_k^† with two GEMMs
+        if self._L_ops:
+            self._Lh = np.concatenate(self._L_ops, axis=1)
+            self._Ldh = np.concatenate(self._Ldag, axis=1)
+            self._LdL_sum = sum(self._LdL)
+        self._D = None  # cached dissipator superoperator, built on first use
+        self._drop_caches()
+
+    def _build_dissipator(self, d: int) -> np.ndarray:
+        """Dissipator superoperator on the row-major vec(rho) = rho.reshape(-1).
+
+        With that ordering vec(A @ X @ B) = kron(A, B.T) @ vec(X).
+        """
+        eye = np.eye(d, dtype=self.dtype)
+        D = np.zeros((d * d, d * d), dtype=self.dtype)
+        for Lk, Ld, LdL in zip(self._L_ops, self._Ldag, self._LdL):
+            D += np.kron(Lk, Ld.T)  # Ld.T is conj(Lk), as a view
+            D -= 0.5 * (np.kron(LdL, eye) + np.kron(eye, LdL.T))
+        return D
+
+    def _dissipator(self, d: int) -> np.ndarray:
+        if self._D is None or self._D.shape[0] != d * d:
+            self._D = self._build_dissipator(d)
+        return self._D
+
+    def _liouvillian(self, d: int) -> np.ndarray:
+        """Full Liouvillian (dissipator plus -i[H, .]), for the propagator."""
+        if self._L is None or self._L.shape[0] != d * d:
+            L = self._dissipator(d).copy()
+            if self._h_diag is not None:
+                # vec index i*d + j picks up -i (h_i - h_j)
+                L[np.diag_indices(d * d)] += self._diag_commutator().reshape(-1)
+            elif self._H is not None:
+                eye = np.eye(d, dtype=self.dtype)
+                L += -1j * (np.kron(self._H, eye) - np.kron(eye, self._H.T))
+            self._L = L
+        return self._L
+
+    def _numba_args(self, d: int):
+        if self._nb_args is None or self._nb_args[0].shape[0] != d:
+            zeros = np.zeros((d, d), dtype=self.dtype)
+            H = zeros if self.H is None else np.ascontiguousarray(self.H)
+            if self._L_ops:
+                Ls = np.stack(self._L_ops)
+                Lds = np.stack(self._Ldag)
+                LdL = np.ascontiguousarray(self._LdL_sum)
+            else:
+                Ls = Lds = np.zeros((0, d, d), dtype=self.dtype)
+                LdL = zeros
+            self._nb_args = (H, Ls, Lds, LdL)
+        return self._nb_args
 
     @staticmethod
-    def _superop_term(L: np.ndarray, rho: np.ndarray) -> np.ndarray:
-        Lrho = L @ rho @ L.conj().T
-        anti = -0.5 * (L.conj().T @ L @ rho + rho @ L.conj().T @ L)
-        return Lrho + anti
+    def _renormalize(rho: np.ndarray) -> np.ndarray:
+        # The generator is trace-preserving, so the trace only drifts by
+        # rounding and stays away from zero for any valid density operator;
+        # no per-step guard is needed.
+        # Accumulated in double precision whatever rho's dtype, so complex64
+        # runs do not drift in trace over many steps
+        rho *= 1.0 / np.einsum('ii->', rho, dtype=np.complex128).real
+        return rho
+
+    def _scratch(self, rho: np.ndarray):
+        if self._tmp is None or self._tmp[0].shape != rho.shape:
+            self._tmp = (np.empty_like(rho), np.empty_like(rho))
+        return self._tmp
+
+    def _commutator_term(self, rho: np.ndarray, out: np.ndarray):
+        """Write -i [H, rho] into out (zeros when there is no H)."""
+        if self._h_diag is not None:
+            np.multiply(self._diag_commutator(), rho, out=out)
+        elif self._H is not None:
+            t1 = self._scratch(rho)[0]
+            np.matmul(self._H, rho, out=out)
+            np.matmul(rho, self._H, out=t1)
+            out -= t1
+            out *= -1j
+        else:
+            out.fill(0)
+
+    def _dissipate(self, rho: np.ndarray, d_rho: np.ndarray):
+        """Accumulate sum_k (L_k rho L_k^† - 0.5 {L_k^†L_k, rho}) into d_rho.
+
+        All k operators go through two batched products rather than a
+        Python loop: X = rho @ [L_1^† .. L_k^†], restacked to (k*d, d), then
+        [L_1 .. L_k] @ X. The anticommutator uses the pre-summed L^†L.
+        """
+        d = rho.shape[0]
+        k = len(self._L_ops)
+        t1, t2 = self._scratch(rho)
+        X = (rho @ self._Ldh).reshape(d, k, d).transpose(1, 0, 2).reshape(k * d, d)
+        np.matmul(self._Lh, X, out=t1)
+        d_rho += t1
+        np.matmul(self._LdL_sum, rho, out=t1)
+        np.matmul(rho, self._LdL_sum, out=t2)
+        t1 += t2
+        t1 *= 0.5
+        d_rho -= t1
 
-    def step(self, rho: np.ndarray, dt: float = 0.01) -> np.ndarray:
-        """Perform a single Lindblad dt update (first-order Euler)."""
+    @staticmethod
+    def _out_buffer(rho: np.ndarray, out: Optional[np.ndarray]) -> np.ndarray:
+        if out is None:
+            return np.empty_like(rho)
+        if out.shape != rho.shape or not out.flags.c_contiguous or np.shares_memory(out, rho):
+            raise ValueError("out must be a C-contiguous array shaped like rho that does not overlap it")
+        return out
+
+    def step(self, rho: np.ndarray, dt: float = 0.01, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Perform a single Lindblad dt update (first-order Euler).
+
+        rho must have a non-zero trace; the result is renormalized to trace 1.
+        If out is given, the result is written there (and returned) instead of
+        a fresh array.
+        """
         if rho is None:
             raise ValueError("rho must be provided")
-        rho = rho.astype(complex)
-        d_rho = np.zeros_like(rho, dtype=complex)
-        if self.H is not None:
-            d_rho += -1j * (self.H @ rho - rho @ self.H)
-        for L in self.L_ops:
-            d_rho += self._superop_term(L, rho)
-        rho_next = rho + dt * d_rho
+        rho = rho.astype(self.dtype, copy=False)
+        d = rho.shape[0]
+        rho_next = self._out_buffer(rho, out)
+        if _lindblad_step_numba is not None and d < NUMBA_MAX_DIM:
+            np.copyto(rho_next, _lindblad_step_numba(rho, *self._numba_args(d), dt))
+            return rho_next
+        # rho_next first accumulates d_rho, then becomes rho + dt * d_rho
+        self._commutator_term(rho, rho_next)
+        if self._L_ops:
+            if d <= LIOUVILLIAN_MAX_DIM:
+                t1 = self._scratch(rho)[0]
+                np.matmul(self._dissipator(d), rho.reshape(-1), out=t1.reshape(-1))
+                rho_next += t1
+            else:
+                self._dissipate(rho, rho_next)
+        rho_next *= dt
+        rho_next += rho
         # Renormalize trace to 1 (density operator property)
-        tr = np.trace(rho_next)
-        if np.abs(tr) > 0:
-            rho_next /= tr
-        return rho_next
+        return self._renormalize(rho_next)
+
+    def propagate(self, rho: np.ndarray, dt: float = 0.01, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Advance rho by dt with the exact propagator expm(L * dt).
+
+        The propagator is cached until dt, H or L_ops change, so repeated
+        steps cost one matvec each. Falls back to step() when scipy is
+        unavailable or the system is too large for the superoperator form.
+        """
+        if rho is None:
+            raise ValueError("rho must be provided")
+        d = rho.shape[0]
+        if expm is None or d > LIOUVILLIAN_MAX_DIM:
+            return self.step(rho, dt=dt, out=out)
+        if self._P is None or self._P_dt != dt or self._P.shape[0] != d * d:
+            self._P = expm(self._liouvillian(d) * dt)
+            self._P_dt = dt
+        rho = rho.astype(self.dtype, copy=False)
+        rho_next = self._out_buffer(rho, out)
+        np.matmul(self._P, rho.reshape(-1), out=rho_next.reshape(-1))
+        return self._renormalize(rho_next)
 
 
 # --------------------------
@@ -196,23 +518,46 @@ class LindbladDissipator:
 class RealitySynthesisEngine:
     """Top-level kernel managing the Mytho-Quantum state."""
 
-    def __init__(self, dim: int = 4):
+    def __init__(self, dim: int = 4, dtype: Optional[np.dtype] = None):
         self.dim = max(1, dim)
+        self.dtype = np.dtype(dtype) if dtype is not None else _default_dtype(self.dim)
         self.intent = SovereignIntentVector(dimension=dim)
         self.twin_coil = TwinCoil(alpha=0.5, lambda_s=1.0, psi_c=1.0)
-        self.nonc = NonCommutativeEngine(dim=dim)
+        self.nonc = NonCommutativeEngine(dim=dim, dtype=self.dtype)
         # Hamiltonian derived heuristically from twin-coil synthesis: diagonal matrix
-        base_energy = np.eye(dim, dtype=complex) * (self.twin_coil.synthesis_value() + 0.1)
-        self.lindblad = LindbladDissipator(H=base_energy, lindblad_ops=[])
+        self.lindblad = LindbladDissipator(lindblad_ops=[], dtype=self.dtype)
+        self.lindblad.set_diagonal_hamiltonian(np.full(self.dim, self.twin_coil.synthesis_value() + 0.1))
         # start with maximally-mixed density operator
-        self.rho = np.eye(dim, dtype=complex) / float(dim)
+        self._rho = np.eye(dim, dtype=self.dtype) / float(dim)
+        # Reused per-step buffers: the spare rho the Lindblad step writes into.
+        # step() swaps _rho with it, which is why rho is only exposed as a copy.
+        self._scratch = {
+            "rho": np.empty((self.dim, self.dim), dtype=self.dtype),
+        }
+        # BLAS rank-1 update matching rho's precision (zgerc / cgerc)
+        self._gerc = get_blas_funcs("gerc", dtype=self.dtype) if get_blas_funcs is not None else None
         # environmental friction / atlantean scar parameter (0..1)
         self.atlantean_scar = 0.01
         # protocol zero flag and safety token
         self.unleash_protocol_zero = False
         self._protocol_zero_token = None
-        # locks for thread-safety
-        self._lock = threading.RLock()
+        # lock for thread-safety; no method re-enters it, so a plain Lock suffices
+        self._lock = threading.Lock()
+
+    @property
+    def rho(self) -> np.ndarray:
+        """Copy of the current density operator.
+
+        step() recycles the internal buffers, so the live array is never
+        handed out; a returned copy stays valid across later steps.
+        """
+        with self._lock:
+            return self._rho.copy()
+
+    @rho.setter
+    def rho(self, value: np.ndarray):
+        with self._lock:
+            self._rho = np.array(value, dtype=self.dtype, order="C")
 
     # ----- protocol zero management -----
     def request_protocol_zero(self, confirmer: str) -> str:
@@ -259,6 +604,9 @@ class RealitySynthesisEngine:
 
         Returns a status dict intended for terminal display / telemetry.
         """
+        # Intent phase clock, read before taking the lock; monotonic so
+        # wall-clock adjustments cannot jump the phase
+        phase = time.monotonic() * 1e-3
         with self._lock:
             # 1) Update twin coil (drift influenced by input intent)
             coil_state = self.twin_coil.balance(drift=input_intent_strength * 0.01)
@@ -267,31 +615,41 @@ class RealitySynthesisEngine:
             nc_info = self.nonc.enforce_non_commutativity(min_norm=1e-8)
 
             # 3) Construct a Hamiltonian if Protocol Zero active: amplify synthesis energy
+            # 4) Lindblad step. H changes every tick under Protocol Zero, so it
+            #    integrates directly; otherwise the cached propagator applies.
+            rho_next = self._scratch["rho"]
             if self.unleash_protocol_zero:
-                H = np.eye(self.dim, dtype=complex) * (coil_state["synthesis"] * (1.0 + self.atlantean_scar))
+                energy = coil_state["synthesis"] * (1.0 + self.atlantean_scar)
+                self.lindblad.set_diagonal_hamiltonian(np.full(self.dim, energy))
+                self.lindblad.step(self._rho, dt=dt, out=rho_next)
             else:
-                H = self.lindblad.H
-
-            # 4) Lindblad step
-            self.lindblad.H = H
-            self.rho = self.lindblad.step(self.rho, dt=dt)
+                self.lindblad.propagate(self._rho, dt=dt, out=rho_next)
+            # Swap buffers: the old rho becomes next tick's output buffer
+            self._scratch["rho"], self._rho = self._rho, rho_next
 
             # 5) Intent coupling: small unitary kick from Sovereign Intent Vector
-            kick = self.intent.modulate(input_intent_strength, phase=time.time() * 1e-3)
-            # Convert kick into a small Hermitian operator to perturb rho (projector-like)
-            projector = np.outer(kick, kick.conj())
-            if projector.shape[0] != self.dim:
-                # resize projector to dimension (projectors may be rank-deficient); use diagonal embedding
-                p = np.zeros((self.dim, self.dim), dtype=complex)
-                n = min(self.dim, projector.shape[0])
-                p[:n, :n] = projector[:n, :n]
-                projector = p
+            kick = self.intent.modulate(input_intent_strength, phase=phase)
+            # The kick defines a rank-1 projector k k^† / |k|^2 (trace 1)
+            k = kick[:self.dim].astype(self.dtype)
+            if k.shape[0] != self.dim:
+                # shorter kicks are zero-padded (diagonal embedding)
+                k = np.concatenate((k, np.zeros(self.dim - k.shape[0], dtype=self.dtype)))
+            n2 = np.vdot(k, k).real
             # Mix projector into rho scaled by intent_strength and atlantean_scar
             mix_strength = float(abs(input_intent_strength)) * (0.01 + self.atlantean_scar)
-            self.rho = (1.0 - mix_strength) * self.rho + mix_strength * (projector / (np.trace(projector) + 1e-12))
+            self._rho *= 1.0 - mix_strength
+            if n2 > 0.0:
+                alpha = mix_strength / n2
+                if self._gerc is not None and self._rho.flags.c_contiguous:
+                    # rho.T is the Fortran-ordered view BLAS updates in place:
+                    # rho^T += alpha * conj(k) conj(k)^†  <=>  rho += alpha * k k^†
+                    kc = k.conj()
+                    self._gerc(alpha, kc, kc, a=self._rho.T, overwrite_a=1)
+                else:
+                    self._rho += alpha * np.outer(k, k.conj())
 
             # 6) Compute diagnostics
-            purity = float(np.real_if_close(np.trace(self.rho @ self.rho)))
+            purity = _purity(self._rho)
             comm_norm = self.nonc.commutator_norm()
             synthesis_val = coil_state["synthesis"]
 
@@ -303,9 +661,11 @@ class RealitySynthesisEngine:
                 "atlantean_scar": self.atlantean_scar
             }
 
-            # Render for high-fidelity terminal
-            rendered = lioncrow_render("REALITY_SYNTHESIS_STEP", {**status, "dt": dt})
-            logger.info(rendered)
+            # Render for high-fidelity terminal, only if INFO is actually emitted
+            rendered = None
+            if logger.isEnabledFor(logging.INFO):
+                rendered = lioncrow_render("REALITY_SYNTHESIS_STEP", {**status, "dt": dt})
+                logger.info(rendered)
             return {"status": status, "coil": coil_state, "rendered": rendered}
 
     def snapshot(self) -> Dict[str, Any]:
@@ -317,8 +677,8 @@ class RealitySynthesisEngine:
                 "twin_coil": {"alpha": self.twin_coil.alpha, "lambda_s": self.twin_coil.lambda_s, "psi_c": self.twin_coil.psi_c},
                 "protocol_zero": self.unleash_protocol_zero,
                 "atlantean_scar": self.atlantean_scar,
-                "rho_trace": float(np.trace(self.rho)),
-                "rho_purity": float(np.real_if_close(np.trace(self.rho @ self.rho)))
+                "rho_trace": float(np.trace(self._rho)),
+                "rho_purity": _purity(self._rho)
             }
 
 # End of mq_kernel.py
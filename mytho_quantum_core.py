@@ -11,6 +11,16 @@ from inverted_sigil_recycler import recycler
 logging.basicConfig(level=logging.INFO, format='%(asctime)s [%(levelname)s] %(message)s')
 
 
+# Line formats are parsed once; the bound .format methods are reused per item
+_FLOAT_LINE = "  - {}: {:.6f}".format
+_REPR_LINE = "  - {}: {!r}".format
+
+
+def _render_body(items) -> str:
+    # Technical precision: float formatting to 6 significant figures where relevant
+    return "\n".join([_FLOAT_LINE(k, v) if isinstance(v, float) else _REPR_LINE(k, v) for k, v in items])
+
+
 def lioncrow_render(title: str, payload: Dict[str, Any]) -> str:
     """LionCrow_Will terminal-grade renderer.
     Produces a high-fidelity, precision-formatted single-line summary plus a
@@ -18,14 +28,7 @@ def lioncrow_render(title: str, payload: Dict[str, Any]) -> str:
     """
     ts = time.strftime('%Y-%m-%d %H:%M:%S', time.gmtime())
     header = f"[{ts}] :: LIONCROW_WILL :: {title}"
-    # Technical precision: float formatting to 6 significant figures where relevant
-    body_lines = []
-    for k, v in payload.items():
-        if isinstance(v, float):
-            body_lines.append(f"  - {k}: {v:.6f}")
-        else:
-            body_lines.append(f"  - {k}: {repr(v)}")
-    return header + "\n" + "\n".join(body_lines)
+    return header + "\n" + _render_body(payload.items())
 
 
 class EternalNode:
@@ -68,14 +71,11 @@ class TheWatchman(EternalNode):
         """
         with self.monitor_lock:
             self.last_checked = time.time()
-            uptime_hours = float(uptime_seconds) / 3600.0
-            # Defensive: ensure non-negative values
+            # Defensive: ensure non-negative values. With both inputs
+            # non-negative the ratio is already in [0, 1), so no guard or clamp.
+            uptime_hours = max(0.0, float(uptime_seconds)) / 3600.0
             error_count = max(0, int(error_count))
-
-            coherence = 0.0
-            if uptime_hours + error_count + 1.0 > 0:
-                coherence = uptime_hours / (uptime_hours + error_count + 1.0)
-            coherence = max(0.0, min(1.0, float(coherence)))
+            coherence = uptime_hours / (uptime_hours + error_count + 1.0)
 
             payload = {
                 'node': self.name,
@@ -84,8 +84,11 @@ class TheWatchman(EternalNode):
                 'coherence': coherence
             }
 
-            rendered = lioncrow_render(f"{self.name} :: MONITOR_STATIC", payload)
-            logging.info(rendered)
+            # Only render when INFO is actually emitted; callers get None otherwise
+            rendered = None
+            if logging.root.isEnabledFor(logging.INFO):
+                rendered = lioncrow_render(f"{self.name} :: MONITOR_STATIC", payload)
+                logging.info(rendered)
 
             action_result = None
             if coherence < self.COHERENCE_THRESHOLD:
@@ -101,7 +104,8 @@ class TheWatchman(EternalNode):
                     # The existing recycler API is consume_failure(error_data)
                     action_result = recycler.consume_failure(reason)
                     self.last_action = action_result
-                    logging.info(lioncrow_render(f"{self.name} :: INVOKED_INVERTEDSIGIL", {'result': action_result}))
+                    if logging.root.isEnabledFor(logging.INFO):
+                        logging.info(lioncrow_render(f"{self.name} :: INVOKED_INVERTEDSIGIL", {'result': action_result}))
                 except Exception as exc:
                     logging.error(lioncrow_render(f"{self.name} :: RECYCLER_EXCEPTION", {'exc': str(exc)}))
 
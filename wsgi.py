@@ -0,0 +1,3 @@
+# WSGI entry point for production servers:
+#   gunicorn -c gunicorn.conf.py wsgi:application
+from app import app as application